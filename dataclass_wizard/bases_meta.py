@@ -131,13 +131,19 @@ class BaseJSONWizardMeta(AbstractMeta):
                 # already serializes using this approach.
                 pass
 
+        # Note: we set the underlying function for the `LetterCase` member,
+        # so that we don't need to go through `LetterCase.__call__` (and the
+        # wrapper) each time we transform a key.
+
         if cls.key_transform_with_load:
-            cls_loader.transform_json_field = cls._as_enum_safe(
-                'key_transform_with_load', LetterCase)
+            cls_loader.transform_json_field = staticmethod(
+                cls._as_enum_safe(
+                    'key_transform_with_load', LetterCase).value.f)
 
         if cls.key_transform_with_dump:
-            cls_dumper.transform_dataclass_field = cls._as_enum_safe(
-                'key_transform_with_dump', LetterCase)
+            cls_dumper.transform_dataclass_field = staticmethod(
+                cls._as_enum_safe(
+                    'key_transform_with_dump', LetterCase).value.f)
 
         # Finally, if needed, save the meta config for the outer class. This
         # will allow us to access this config as part of the JSON load/dump
@@ -116,11 +116,11 @@ def dataclass_field_to_load_parser(
     """
     Returns a mapping of each lower-cased field name to its annotated type.
     """
-    if cls not in _FIELD_NAME_TO_LOAD_PARSER:
+    try:
+        return _FIELD_NAME_TO_LOAD_PARSER[cls]
+    except KeyError:
         return _setup_load_config_for_cls(cls_loader, cls, config, save)
 
-    return _FIELD_NAME_TO_LOAD_PARSER[cls]
-
 
 def _setup_load_config_for_cls(cls_loader: Type[AbstractLoader],
                                cls: Type,
@@ -282,10 +282,11 @@ def dataclass_fields(cls) -> Tuple[Field, ...]:
     ends up around 5x faster than making a fresh call each time.
 
     """
-    if cls not in _FIELDS:
-        _FIELDS[cls] = fields(cls)
-
-    return _FIELDS[cls]
+    try:
+        return _FIELDS[cls]
+    except KeyError:
+        _FIELDS[cls] = cls_fields = fields(cls)
+        return cls_fields
 
 
 def dataclass_init_fields(cls) -> Tuple[Field, ...]:
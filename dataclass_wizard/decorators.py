@@ -3,6 +3,7 @@ from typing import Any, Dict, Type, Callable, Union, TypeVar, cast
 
 from .constants import SINGLE_ARG_ALIAS, IDENTITY
 from .errors import ParseError
+from .utils.wrappers import cached_property
 
 
 T = TypeVar('T')
@@ -34,26 +35,6 @@ class cached_class_property(object):
         return attr
 
 
-class cached_property(object):
-    """
-    Descriptor decorator implementing an instance-level, read-only property,
-    which caches the attribute on-demand on the first use.
-    """
-    def __init__(self, func):
-        self.__func__ = func
-        self.__attr_name__ = func.__name__
-
-    def __get__(self, instance, cls=None):
-        """This method is only called the first time, to cache the value."""
-        # Build the attribute.
-        attr = self.__func__(instance)
-
-        # Cache the value; hide ourselves.
-        setattr(instance, self.__attr_name__, attr)
-
-        return attr
-
-
 def try_with_load(load_fn: Callable):
     """Try to call a load hook, catch and re-raise errors as a ParseError.
 
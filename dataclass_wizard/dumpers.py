@@ -291,6 +291,22 @@ def dump_func_for_dataclass(cls: Type[T],
     # A collection of field names in the dataclass.
     field_names = dataclass_field_names(cls)
 
+    # Resolve the JSON key for each dataclass field up front, so we don't
+    # need to do a case transformation (or a failed dict lookup) each time
+    # we serialize an instance of the class.
+    for field in field_names:
+        if field not in dataclass_to_json_field:
+            # Normalize the dataclass field name (by default to camel case)
+            dataclass_to_json_field[field] = \
+                cls_dumper.transform_dataclass_field(field)
+
+    # A tuple of each dataclass field to its resolved JSON key; any
+    # dataclass fields that are explicitly ignored are excluded.
+    field_to_json_key = tuple(
+        (field, dataclass_to_json_field[field]) for field in field_names
+        if dataclass_to_json_field[field] is not ExplicitNull
+    )
+
     # Check if we need to auto-assign tags for dataclasses in `Union` types.
     if meta.auto_assign_tags:
         # Unfortunately, we can't handle this as part of the dump process, as
@@ -306,6 +322,11 @@ def dump_func_for_dataclass(cls: Type[T],
     # Tag key to populate when a dataclass is in a `Union` with other types.
     tag_key = meta.tag_key or TAG
 
+    # Bind the globals called in the loop in `cls_asdict` once, as closure
+    # variables, since these are faster to look up than globals (or builtins).
+    _getattr = getattr
+    asdict_inner = _asdict_inner
+
     def cls_asdict(obj: T, dict_factory=dict,
                    exclude: List[str] = None,
                    skip_defaults=meta.skip_defaults) -> JSONObject:
@@ -320,27 +341,14 @@ def dump_func_for_dataclass(cls: Type[T],
         # serialized value.
         result = []
 
-        # Loop over the dataclass fields
-        for field in field_names:
-
-            # Get the resolved JSON field name
-            try:
-                json_field = dataclass_to_json_field[field]
+        # Loop over the dataclass fields, and their resolved JSON keys
+        for field, json_field in field_to_json_key:
 
-            except KeyError:
-                # Normalize the dataclass field name (by default to camel
-                # case)
-                json_field = cls_dumper.transform_dataclass_field(field)
-                dataclass_to_json_field[field] = json_field
-
-            # Exclude any dataclass fields that are explicitly ignored.
-            if json_field is ExplicitNull:
-                continue
             if exclude and field in exclude:
                 continue
 
             # -- This line is *mostly* the same as in the original version --
-            fv = getattr(obj, field)
+            fv = _getattr(obj, field)
 
             # Check if we need to strip defaults, and the field currently
             # is assigned a default value.
@@ -351,8 +359,8 @@ def dump_func_for_dataclass(cls: Type[T],
                     and fv == field_to_default[field]:
                 continue
 
-            value = _asdict_inner(fv, dict_factory, hooks, config,
-                                  nested_cls_to_dump_func)
+            value = asdict_inner(fv, dict_factory, hooks, config,
+                                 nested_cls_to_dump_func)
 
             # -- This line is *mostly* the same as in the original version --
             result.append((json_field, value))
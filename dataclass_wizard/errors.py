@@ -1,43 +1,80 @@
 import json
-from abc import ABC, abstractmethod
 from dataclasses import Field, MISSING
 from typing import (Any, Type, Dict, Tuple, ClassVar,
-                    Optional, Union, Iterable)
+                    Optional, Union, Iterable, Callable, List)
 
 from .utils.string_conv import normalize
+from .utils.wrappers import cached_property
 
 
 # added as we can't import from `type_def`, as we run into a circular import.
 JSONObject = Dict[str, Any]
 
+# Used to serialize the input JSON object in error messages. The encoder
+# output is consumed in chunks, so that we can stop early on large objects.
+_JSON_ENCODER = json.JSONEncoder()
 
-class JSONWizardError(ABC, Exception):
+
+class JSONWizardError(Exception):
     """
     Base error class, for errors raised by this library.
     """
 
-    _TEMPLATE: ClassVar[str]
+    # Formats the error message from its parts. This is a function (rather
+    # than a template string) so that the message is built via f-strings,
+    # which avoids parsing a format string on each call.
+    _render: ClassVar[Callable[..., str]]
+
+    # The maximum length of a JSON string to include in an error message;
+    # anything longer than this is truncated. Set to 0 to disable.
+    _JSON_STRING_LIMIT: ClassVar[int] = 2048
 
     @property
-    @abstractmethod
     def message(self) -> str:
         """
         Format and return an error message.
         """
+        raise NotImplementedError
 
     def __str__(self):
         return self.message
 
+    def _json_string(self, obj: Any) -> str:
+        """
+        Serialize an object `obj` to a JSON string for use in an error
+        message, truncating the result if it is longer than the limit.
+        """
+        limit = self._JSON_STRING_LIMIT
+        if not limit:
+            return json.dumps(obj)
+
+        # Note: `iterencode` always uses the pure-Python encoder, which is a
+        # few times slower than `json.dumps` for small objects. This is an
+        # acceptable trade-off on the error path, as in return we can stop
+        # early instead of serializing a (potentially huge) object in full.
+        chunks = []
+        length = 0
+
+        for chunk in _JSON_ENCODER.iterencode(obj):
+            chunks.append(chunk)
+            length += len(chunk)
+            if length > limit:
+                return ''.join(chunks)[:limit] + '...'
+
+        return ''.join(chunks)
+
 
 class ParseError(JSONWizardError):
     """
     Base error when an error occurs during the JSON load process.
     """
 
-    _TEMPLATE = ('Failure parsing field `{field}` in class `{cls}`. Expected '
-                 'a type {ann_type}, got {obj_type}.\n'
-                 '  value: {o!r}\n'
-                 '  error: {e!s}')
+    @staticmethod
+    def _render(cls_name, field, e, o, ann_type, obj_type) -> str:
+        return (f'Failure parsing field `{field}` in class `{cls_name}`. '
+                f'Expected a type {ann_type}, got {obj_type}.\n'
+                f'  value: {o!r}\n'
+                f'  error: {e!s}')
 
     def __init__(self, base_err: Exception,
                  obj: Any,
@@ -55,14 +92,16 @@ class ParseError(JSONWizardError):
         self.base_error = base_err
         self.kwargs = kwargs
         self._class_name = None
-        self._default_class_name = self.name(_default_class) \
-            if _default_class else None
+        self._default_class = _default_class
         self._field_name = _field_name
         self._json_object = _json_object
 
     @property
     def class_name(self) -> Optional[str]:
-        return self._class_name or self._default_class_name
+        if self._class_name is None and self._default_class:
+            return self.name(self._default_class)
+
+        return self._class_name
 
     @class_name.setter
     def class_name(self, cls: Optional[Type]):
@@ -94,14 +133,14 @@ class ParseError(JSONWizardError):
 
     @property
     def message(self) -> str:
-        msg = self._TEMPLATE.format(
-            cls=self.class_name, field=self.field_name,
-            e=self.base_error, o=self.obj,
-            ann_type=self.name(self.ann_type),
-            obj_type=self.name(self.obj_type))
+        msg = self._render(
+            self.class_name, self.field_name,
+            self.base_error, self.obj,
+            self.name(self.ann_type),
+            self.name(self.obj_type))
 
         if self.json_object:
-            self.kwargs['json_object'] = json.dumps(self.json_object)
+            self.kwargs['json_object'] = self._json_string(self.json_object)
 
         if self.kwargs:
             sep = '\n  '
@@ -117,12 +156,14 @@ class MissingFields(JSONWizardError):
     missing arguments)
     """
 
-    _TEMPLATE = ('Failure calling constructor method of class `{cls}`. '
-                 'Missing values for required dataclass fields.\n'
-                 '  have fields: {fields!r}\n'
-                 '  missing fields: {missing_fields!r}\n'
-                 '  input JSON object: {json_string}\n'
-                 '  error: {e!s}')
+    @staticmethod
+    def _render(cls_name, json_string, e, fields, missing_fields) -> str:
+        return (f'Failure calling constructor method of class `{cls_name}`. '
+                'Missing values for required dataclass fields.\n'
+                f'  have fields: {fields!r}\n'
+                f'  missing fields: {missing_fields!r}\n'
+                f'  input JSON object: {json_string}\n'
+                f'  error: {e!s}')
 
     def __init__(self, base_err: Exception,
                  obj: JSONObject,
@@ -133,32 +174,58 @@ class MissingFields(JSONWizardError):
         super().__init__()
 
         self.obj = obj
-        self.fields = list(cls_kwargs.keys())
-
-        self.missing_fields = [f.name for f in cls_fields
-                               if f.name not in self.fields
-                               and f.default is MISSING
-                               and f.default_factory is MISSING]
+        self.base_error = base_err
+        self.class_name: str = self.name(cls)
 
+        # The below attributes are only needed to compute `fields`,
+        # `missing_fields`, and `kwargs`, which we do lazily on first access,
+        # since the error might be caught and discarded.
+        self._cls = cls
+        self._cls_kwargs = cls_kwargs
+        self._cls_fields = cls_fields
+        self._kwargs = kwargs
+
+    @cached_property
+    def fields(self) -> List[str]:
+        """The dataclass fields which were passed to the constructor."""
+        return list(self._cls_kwargs.keys())
+
+    @cached_property
+    def missing_fields(self) -> List[str]:
+        """The required dataclass fields which are missing values."""
+        fields = self.fields
+        return [f.name for f in self._cls_fields
+                if f.name not in fields
+                and f.default is MISSING
+                and f.default_factory is MISSING]
+
+    @cached_property
+    def kwargs(self) -> Dict[str, Any]:
+        """Any additional info to include in the error message."""
+        self._add_key_transform_info(self._kwargs)
+        return self._kwargs
+
+    def _add_key_transform_info(self, kwargs: Dict[str, Any]):
         # check if any field names match, and where the key transform could be the cause
         # see https://github.com/rnag/dataclass-wizard/issues/54 for more info
 
-        normalized_json_keys = [normalize(key) for key in obj]
-        if next((f for f in self.missing_fields if normalize(f) in normalized_json_keys), None):
+        # Note: `normalize` caches its results, so the normalized names of
+        # the dataclass fields are only computed once across errors.
+        normalized_json_keys = {normalize(key) for key in self.obj}
+        if not normalized_json_keys.isdisjoint(map(normalize, self.missing_fields)):
             from .enums import LetterCase
             from .loaders import get_loader
 
-            key_transform = get_loader(cls).transform_json_field
+            key_transform = get_loader(self._cls).transform_json_field
+            # Note: a `Meta` config binds the underlying function for the
+            # `LetterCase` member, so this only applies to `LoadMixin`
+            # sub-classes that assign a `LetterCase` member directly.
             if isinstance(key_transform, LetterCase):
                 key_transform = key_transform.value.f
 
             kwargs['key transform'] = f'{key_transform.__name__}()'
             kwargs['resolution'] = 'For more details, please see https://github.com/rnag/dataclass-wizard/issues/54'
 
-        self.base_error = base_err
-        self.kwargs = kwargs
-        self.class_name: str = self.name(cls)
-
     @staticmethod
     def name(obj) -> str:
         """Return the type or class name of an object"""
@@ -166,12 +233,12 @@ class MissingFields(JSONWizardError):
 
     @property
     def message(self) -> str:
-        msg = self._TEMPLATE.format(
-            cls=self.class_name,
-            json_string=json.dumps(self.obj),
-            e=self.base_error,
-            fields=self.fields,
-            missing_fields=self.missing_fields)
+        msg = self._render(
+            self.class_name,
+            self._json_string(self.obj),
+            self.base_error,
+            self.fields,
+            self.missing_fields)
 
         if self.kwargs:
             sep = '\n  '
@@ -190,10 +257,13 @@ class UnknownJSONKey(JSONWizardError):
     `raise_on_unknown_json_key` flag is enabled in the :class:`Meta` class.
     """
 
-    _TEMPLATE = ('A JSON key is missing from the dataclass schema for class `{cls}`.\n'
-                 '  unknown key: {json_key!r}\n'
-                 '  dataclass fields: {fields!r}\n'
-                 '  input JSON object: {json_string}')
+    @staticmethod
+    def _render(cls_name, json_string, fields, json_key) -> str:
+        return ('A JSON key is missing from the dataclass schema for class '
+                f'`{cls_name}`.\n'
+                f'  unknown key: {json_key!r}\n'
+                f'  dataclass fields: {fields!r}\n'
+                f'  input JSON object: {json_string}')
 
     def __init__(self,
                  json_key: str,
@@ -204,10 +274,17 @@ class UnknownJSONKey(JSONWizardError):
 
         self.json_key = json_key
         self.obj = obj
-        self.fields = [f.name for f in cls_fields]
         self.kwargs = kwargs
         self.class_name: str = self.name(cls)
 
+        # Only needed to compute `fields`, which we do lazily on first access.
+        self._cls_fields = cls_fields
+
+    @cached_property
+    def fields(self) -> List[str]:
+        """The names of all fields in the dataclass."""
+        return [f.name for f in self._cls_fields]
+
     @staticmethod
     def name(obj) -> str:
         """Return the type or class name of an object"""
@@ -215,11 +292,11 @@ class UnknownJSONKey(JSONWizardError):
 
     @property
     def message(self) -> str:
-        msg = self._TEMPLATE.format(
-            cls=self.class_name,
-            json_string=json.dumps(self.obj),
-            fields=self.fields,
-            json_key=self.json_key)
+        msg = self._render(
+            self.class_name,
+            self._json_string(self.obj),
+            self.fields,
+            self.json_key)
 
         if self.kwargs:
             sep = '\n  '
@@ -235,11 +312,13 @@ class MissingData(ParseError):
     is None.
     """
 
-    _TEMPLATE = ('Failure loading class `{cls}`. '
-                 'Missing value for field (expected a dict, got None)\n'
-                 '  dataclass field: {field!r}\n'
-                 '  resolution: annotate the field as '
-                 '`Optional[{nested_cls}]` or `{nested_cls} | None`')
+    @staticmethod
+    def _render(cls_name, nested_cls, field) -> str:
+        return (f'Failure loading class `{cls_name}`. '
+                'Missing value for field (expected a dict, got None)\n'
+                f'  dataclass field: {field!r}\n'
+                '  resolution: annotate the field as '
+                f'`Optional[{nested_cls}]` or `{nested_cls} | None`')
 
     def __init__(self, nested_cls: Type, **kwargs):
         super().__init__(self, None, nested_cls, **kwargs)
@@ -252,12 +331,10 @@ class MissingData(ParseError):
 
     @property
     def message(self) -> str:
-        msg = self._TEMPLATE.format(
-            cls=self.class_name,
-            nested_cls=self.nested_class_name,
-            json_string=json.dumps(self.obj),
-            field=self.field_name,
-            o=self.obj,
+        msg = self._render(
+            self.class_name,
+            self.nested_class_name,
+            self.field_name,
         )
 
         if self.kwargs:
@@ -6,15 +6,26 @@ __all__ = ['normalize',
            'repl_or_with_union']
 
 import re
+from functools import lru_cache
 from typing import Iterable, Dict, List
 
 
+# Translation table which strips out any dashes and underscores, so that
+# `normalize` only needs a single pass over the string before upper-casing.
+_NORMALIZE_TABLE = str.maketrans('', '', '-_')
+
+
+@lru_cache(maxsize=2048)
 def normalize(string: str) -> str:
     """
     Normalize a string - typically a dataclass field name - for comparison
     purposes.
     """
-    return string.replace('-', '').replace('_', '').upper()
+    # Short path: the string is already normalized, so return it as-is.
+    if string.isupper() and '-' not in string and '_' not in string:
+        return string
+
+    return string.translate(_NORMALIZE_TABLE).upper()
 
 
 def to_camel_case(string: str) -> str:
@@ -61,18 +72,12 @@ def to_lisp_case(string: str) -> str:
         'device-type'
 
     """
-    string = string.replace('_', '-').replace(' ', '-')
-    # Short path: the field is already lower-cased, so we don't need to handle
-    # for camel or title case.
-    if string.islower():
-        return replace_multi_with_single(string, '-')
-
-    result = re.sub(
-        r'((?!^)(?<!-)[A-Z][a-z]+|(?<=[a-z0-9])[A-Z])', r'-\1', string)
-
-    return replace_multi_with_single(result.lower(), '-')
+    # The words are split the same way as in snake case, just joined with a
+    # different separator; so reuse the (cached) result from that function.
+    return to_snake_case(string).replace('_', '-')
 
 
+@lru_cache(maxsize=2048)
 def to_snake_case(string: str) -> str:
     """
     Make an underscored, lowercase form from the expression in the string.
@@ -83,16 +88,37 @@ def to_snake_case(string: str) -> str:
         'device_type'
 
     """
+    # Short path: the field is already snake-cased, so return it as-is.
+    if string.islower() and '-' not in string and ' ' not in string \
+            and '__' not in string:
+        return string
+
     string = string.replace('-', '_').replace(' ', '_')
     # Short path: the field is already lower-cased, so we don't need to handle
     # for camel or title case.
     if string.islower():
         return replace_multi_with_single(string)
 
-    result = re.sub(
-        r'((?!^)(?<!_)[A-Z][a-z]+|(?<=[a-z0-9])[A-Z])', r'_\1', string)
+    # Insert an underscore before an (ASCII) upper-cased letter, when it is
+    # not the first character and either comes after a lower-cased letter or
+    # digit, or starts a new title-cased word (ex. the `T` in `ATitle`). This
+    # is equivalent to the below regex substitution, but is about twice as
+    # fast, as we only need a single pass over the string:
+    #   re.sub(r'((?!^)(?<!_)[A-Z][a-z]+|(?<=[a-z0-9])[A-Z])', r'_\1', string)
+    chars = []
+    append = chars.append
+    prev = ''
+    last = len(string) - 1
+
+    for i, c in enumerate(string):
+        if 'A' <= c <= 'Z' and i and (
+                'a' <= prev <= 'z' or '0' <= prev <= '9'
+                or (prev != '_' and i < last and 'a' <= string[i + 1] <= 'z')):
+            append('_')
+        append(c)
+        prev = c
 
-    return replace_multi_with_single(result.lower())
+    return replace_multi_with_single(''.join(chars).lower())
 
 
 def replace_multi_with_single(string: str, char='_') -> str:
@@ -106,10 +132,9 @@ def replace_multi_with_single(string: str, char='_') -> str:
     return string
 
 
-# Note: this is the initial helper function I came up with. This doesn't use
-# regex for the string transformation, so it's actually faster than the
-# implementation above. However, I do prefer the implementation with regex,
-# because its a lot cleaner and more simple than this implementation.
+# Note: this is the initial helper function I came up with, before the
+# regex-based version that `to_snake_case` used until it was replaced with the
+# single-pass character walk above.
 # def to_snake_case_old(string: str):
 #     """
 #     Make an underscored, lowercase form from the expression in the string.
@@ -19,3 +19,23 @@ class FuncWrapper:
 
     def __call__(self, *args, **kwargs):
         return self.f(*args, **kwargs)
+
+
+class cached_property(object):
+    """
+    Descriptor decorator implementing an instance-level, read-only property,
+    which caches the attribute on-demand on the first use.
+    """
+    def __init__(self, func):
+        self.__func__ = func
+        self.__attr_name__ = func.__name__
+
+    def __get__(self, instance, cls=None):
+        """This method is only called the first time, to cache the value."""
+        # Build the attribute.
+        attr = self.__func__(instance)
+
+        # Cache the value; hide ourselves.
+        setattr(instance, self.__attr_name__, attr)
+
+        return attr
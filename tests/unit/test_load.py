@@ -17,6 +17,9 @@ import pytest
 
 from dataclass_wizard import *
 from dataclass_wizard.constants import TAG
+from dataclass_wizard.decorators import (
+    try_with_load, try_with_load_with_single_arg
+)
 from dataclass_wizard.errors import (
     ParseError, MissingFields, UnknownJSONKey, MissingData
 )
@@ -178,6 +181,29 @@ def test_invalid_types_with_debug_mode_enabled():
     assert (err.ann_type, err.obj_type) == (int, dict)
 
 
+@pytest.mark.skipif(PY36, reason='requires Python 3.7 or higher')
+def test_invalid_nested_type_with_debug_mode_enabled():
+    """
+    When DEBUG mode is enabled, the outer load hooks update the error with
+    the outer object, but the error should still report the type of the
+    value that failed to parse.
+    """
+    @dataclass
+    class MyClass(JSONWizard):
+        class _(JSONWizard.Meta):
+            debug_enabled = True
+
+        xs: Dict[str, List[int]]
+
+    with pytest.raises(ParseError) as e:
+        _ = MyClass.from_dict({'xs': {'a': ['abc']}})
+
+    err = e.value
+    assert err.obj == {'a': ['abc']}
+    assert (err.ann_type, err.obj_type) == (int, str)
+    assert 'Expected a type int, got str.' in str(err)
+
+
 @pytest.mark.skipif(PY36, reason='requires Python 3.7 or higher')
 def test_from_dict_called_with_incorrect_type():
     """
@@ -201,6 +227,80 @@ def test_from_dict_called_with_incorrect_type():
     assert (err.ann_type, err.obj_type) == (dict, list)
 
 
+def test_parse_error_message_is_updated_when_context_is_set():
+    """
+    The formatted message for a :class:`ParseError` should include the
+    class and field name when they are set afterwards.
+    """
+    @dataclass
+    class MyClass:
+        my_int: int
+
+    err = ParseError(ValueError('invalid literal'), 'testing', int)
+
+    msg = str(err)
+    assert 'field `None` in class `None`' in msg
+
+    err.class_name = MyClass
+    err.field_name = 'my_int'
+
+    msg = str(err)
+    assert f'field `my_int` in class `{MyClass.__qualname__}`' in msg
+
+
+def test_parse_error_message_reflects_updated_obj_and_kwargs():
+    """
+    The formatted message for a :class:`ParseError` should always reflect
+    the current state of the error, for example when a user hook annotates
+    the error before re-raising it.
+    """
+    err = ParseError(ValueError('x'), 'abc', int)
+    assert "value: 'abc'" in str(err)
+
+    err.kwargs['hint'] = 'h'
+    err.obj = 'zzz'
+
+    msg = str(err)
+    assert "value: 'zzz'" in msg
+    assert "hint: 'h'" in msg
+
+
+def test_parse_error_message_is_updated_by_outer_load_hooks():
+    """
+    The formatted message for a :class:`ParseError` should include the load
+    hook and object set by the outer load hooks in DEBUG mode, even if the
+    error was already converted to a string.
+    """
+    def inner_hook(o, base_type):
+        err = ParseError(ValueError('invalid literal'), o, base_type)
+        # e.g. the error is logged before it's re-raised
+        assert "value: 'abc'" in str(err)
+        raise err
+
+    wrapped_inner = try_with_load(inner_hook)
+
+    def outer_hook(o, base_type):
+        return wrapped_inner(o['key'], base_type)
+
+    wrapped_outer = try_with_load(outer_hook)
+
+    with pytest.raises(ParseError) as e:
+        wrapped_outer({'key': 'abc'}, int)
+
+    msg = str(e.value)
+    assert "value: {'key': 'abc'}" in msg
+    assert "load_hook: 'outer_hook'" in msg
+
+    wrapped_single_arg = try_with_load_with_single_arg(
+        outer_hook, lambda o: inner_hook(o, int), int)
+
+    with pytest.raises(ParseError) as e:
+        wrapped_single_arg('abc')
+
+    msg = str(e.value)
+    assert "load_hook: 'outer_hook'" in msg
+
+
 @pytest.mark.skipif(PY36, reason='requires Python 3.7 or higher')
 def test_date_times_with_custom_pattern():
     """
@@ -533,6 +633,58 @@ def test_from_dict_with_missing_fields_with_resolution():
     assert 'resolution' in e.value.kwargs
 
 
+def test_from_dict_with_missing_fields_and_large_json_object():
+    """
+    Calling `from_dict` when required dataclass field(s) are missing in a
+    large JSON object; the JSON string in the error message is truncated.
+    """
+
+    @dataclass
+    class MyClass(JSONSerializable):
+        my_str: str
+        my_int: int
+
+    d = {'my_str': 'Testing', 'my_list': ['value'] * 5000}
+
+    with pytest.raises(MissingFields) as e:
+        _ = MyClass.from_dict(d)
+
+    limit = MissingFields._JSON_STRING_LIMIT
+    json_string = str(e.value).split('input JSON object: ', 1)[1]
+    json_string = json_string.split('\n', 1)[0]
+
+    assert json_string.startswith('{"my_str": "Testing"')
+    assert json_string.endswith('...')
+    assert len(json_string) == limit + len('...')
+
+
+def test_from_dict_with_missing_fields_and_updated_attributes():
+    """
+    Attributes on a `MissingFields` error can be re-assigned, for example
+    by a caller that wants to customize the error message.
+    """
+
+    @dataclass
+    class MyClass(JSONSerializable):
+        my_str: str
+        my_int: int
+
+    d = {'my_str': 'Testing'}
+
+    with pytest.raises(MissingFields) as e:
+        _ = MyClass.from_dict(d)
+
+    e.value.fields = ['my_field']
+    e.value.missing_fields = ['my_other_field']
+    e.value.kwargs = {'resolution': 'Testing'}
+
+    message = str(e.value)
+
+    assert "have fields: ['my_field']" in message
+    assert "missing fields: ['my_other_field']" in message
+    assert 'resolution: Testing' in message
+
+
 def test_from_dict_key_transform_with_json_field():
     """
     Specifying a custom mapping of JSON key to dataclass field, via the
@@ -97,9 +97,29 @@ def test_to_lisp_case(string, expected):
         ('HIThereHOWIsItGoinG', 'hi_there_how_is_it_goin_g'),
         ('How_-Are-_YoUDoing__TeST', 'how_are_yo_u_doing_te_st'),
         ('thisIsWithANumber42ToTEST', 'this_is_with_a_number42_to_test'),
-        ('Number 42 With spaces', 'number_42_with_spaces')
+        ('Number 42 With spaces', 'number_42_with_spaces'),
+        ('_private__field', '_private_field'),
+        ('naïveFieldName', 'naïve_field_name'),
     ]
 )
 def test_to_snake_case(string, expected):
     actual = to_snake_case(string)
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    'string,expected',
+    [
+        ('device_type', 'DEVICETYPE'),
+        ('deviceType', 'DEVICETYPE'),
+        ('not-a-tester', 'NOTATESTER'),
+        ('How_-Are-_YoUDoing__TeST', 'HOWAREYOUDOINGTEST'),
+        ('helloworld', 'HELLOWORLD'),
+        ('ALLCAPS', 'ALLCAPS'),
+        ('Number 42 With spaces', 'NUMBER 42 WITH SPACES'),
+        ('', ''),
+    ]
+)
+def test_normalize(string, expected):
+    actual = normalize(string)
+    assert actual == expected